@@ -1,7 +1,13 @@
 from pathlib import Path
-from yaml import safe_load
 from typing import Any
 
+from yaml import load
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml C 加速解析器
+except ImportError:
+    from yaml import SafeLoader
+
 from app.version import APP_VERSION
 
 
@@ -43,7 +49,7 @@ class SettingManager:
         加载模式
         """
         with self.CONFIG.open(mode="r", encoding="utf-8") as file:
-            is_dev = safe_load(file).get("Settings", {}).get("DEV", False)
+            is_dev = load(file, Loader=SafeLoader).get("Settings", {}).get("DEV", False)
 
         self.DEBUG = is_dev
 
@@ -88,19 +94,19 @@ class SettingManager:
     @property
     def AlistServerList(self) -> list[dict[str, Any]]:
         with self.CONFIG.open(mode="r", encoding="utf-8") as file:
-            alist_server_list = safe_load(file).get("Alist2StrmList", [])
+            alist_server_list = load(file, Loader=SafeLoader).get("Alist2StrmList", [])
         return alist_server_list
 
     @property
     def Ani2AlistList(self) -> list[dict[str, Any]]:
         with self.CONFIG.open(mode="r", encoding="utf-8") as file:
-            ani2alist_list = safe_load(file).get("Ani2AlistList", [])
+            ani2alist_list = load(file, Loader=SafeLoader).get("Ani2AlistList", [])
         return ani2alist_list
 
     @property
     def TelegramBot(self) -> dict[str, Any]:
         with self.CONFIG.open(mode="r", encoding="utf-8") as file:
-            telegram_bot = safe_load(file).get("TelegramBot", {})
+            telegram_bot = load(file, Loader=SafeLoader).get("TelegramBot", {})
         return telegram_bot
 
 settings = SettingManager()
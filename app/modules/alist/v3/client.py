@@ -1,6 +1,6 @@
-from asyncio import sleep
+from asyncio import Lock, Queue, create_task, gather, sleep, to_thread
 from typing import Callable, AsyncGenerator
-from time import time
+from time import monotonic, time
 
 from httpx import Response
 
@@ -15,6 +15,9 @@ class AlistClient(metaclass=Multiton):
     Alist 客户端 API
     """
 
+    # iter_path 并发遍历目录的最大协程数，与文件处理并发数相互独立
+    MAX_WALKERS: int = 16
+
     def __init__(
         self,
         url: str,
@@ -39,6 +42,7 @@ class AlistClient(metaclass=Multiton):
             "token": "",  # 令牌 token str
             "expires": 0,  # 令牌过期时间（时间戳，-1为永不过期） int
         }
+        self.__token_lock = Lock()
         self.base_path = ""
         self.id = 0
 
@@ -74,7 +78,7 @@ class AlistClient(metaclass=Multiton):
 
         if auth:
             headers = kwargs.get("headers", {})
-            headers["Authorization"] = self.__get_token
+            headers["Authorization"] = await self.__async_get_token()
             kwargs["headers"] = headers
         return await self.__client.request(method, url, **kwargs, sync=False)
 
@@ -128,13 +132,36 @@ class AlistClient(metaclass=Multiton):
             now_stamp = int(time())
 
             if self.__token["expires"] < now_stamp:  # 令牌过期需要重新更新
-                self.__token["token"] = self.api_auth_login()
-                self.__token["expires"] = (
-                    now_stamp + 2 * 24 * 60 * 60 - 5 * 60
-                )  # 2天 - 5分钟（alist 令牌有效期为 2 天，提前 5 分钟刷新）
+                self.__refresh_token()
 
             return self.__token["token"]
 
+    async def __async_get_token(self) -> str:
+        """
+        异步返回可用登录令牌
+        令牌过期时在线程中重新登录，避免阻塞事件循环
+
+        :return: 登录令牌 token
+        """
+
+        if self.__token["expires"] != -1 and self.__token["expires"] < int(time()):
+            async with self.__token_lock:
+                if self.__token["expires"] < int(time()):  # 其他协程可能已完成更新
+                    await to_thread(self.__refresh_token)
+
+        return self.__get_token
+
+    def __refresh_token(self) -> None:
+        """
+        重新登录并更新临时令牌
+        """
+
+        now_stamp = int(time())
+        self.__token["token"] = self.api_auth_login()
+        self.__token["expires"] = (
+            now_stamp + 2 * 24 * 60 * 60 - 5 * 60
+        )  # 2天 - 5分钟（alist 令牌有效期为 2 天，提前 5 分钟刷新）
+
     def api_auth_login(self) -> str:
         """
         登录 Alist 服务器认证账户信息
@@ -362,35 +389,94 @@ class AlistClient(metaclass=Multiton):
         wait_time: float | int,
         is_detail: bool = True,
         filter: Callable[[AlistPath], bool] = lambda x: True,
+        max_workers: int = 1,
     ) -> AsyncGenerator[AlistPath, None]:
         """
         异步路径列表生成器
         返回目录及其子目录的所有文件和目录的 AlistPath 对象
+        由多个协程并发遍历目录，遍历过程中即时返回已发现的路径
+        wait_time 为所有遍历协程共享的请求间隔，不会因并发而缩短
 
         :param dir_path: 目录路径
         :param wait_time: 每轮遍历等待时间（单位秒）,
         :param is_detail：是否获取详细信息（raw_url）
         :param filter: 匿名函数过滤器（默认不启用）
+        :param max_workers: 并发遍历目录的协程数，最多为 MAX_WALKERS（默认为 1）
         :return: AlistPath 对象生成器
         """
 
-        for path in await self.async_api_fs_list(dir_path):
-            if path.is_dir:
-                yield await sleep(wait_time)
-                async for child_path in self.iter_path(
-                    dir_path=path.path,
-                    wait_time=wait_time,
-                    is_detail=is_detail,
-                    filter=filter,
-                ):
-                    yield child_path
-
-            if filter(path):
-                if is_detail:
-                    await sleep(wait_time)
-                    yield await self.async_api_fs_get(path.path)
-                else:
-                    yield path
+        walker_num = max(1, min(max_workers, self.MAX_WALKERS))
+        dir_queue: Queue[str] = Queue()  # 待遍历的目录
+        path_queue: Queue[AlistPath | Exception | None] = Queue(
+            maxsize=walker_num * 2
+        )  # 已发现的路径，队列满时暂停遍历
+        wait_lock = Lock()
+        last_request_time = 0.0  # 上一次请求的时间（monotonic）
+
+        async def wait() -> None:
+            """
+            等待至距离上一次请求满 wait_time 秒
+            所有遍历协程共用，保证整体请求间隔不小于 wait_time
+            """
+            nonlocal last_request_time
+            if wait_time <= 0:
+                return
+            async with wait_lock:
+                delay = last_request_time + wait_time - monotonic()
+                if delay > 0:
+                    await sleep(delay)
+                last_request_time = monotonic()
+
+        async def walker() -> None:
+            """
+            遍历协程
+            从 dir_queue 中取出目录并获取文件列表，子目录放回 dir_queue，文件放入 path_queue
+            """
+            while True:
+                current_dir = await dir_queue.get()
+                try:
+                    if current_dir != dir_path:
+                        await wait()
+                    for path in await self.async_api_fs_list(current_dir):
+                        if path.is_dir:
+                            dir_queue.put_nowait(path.path)
+
+                        if filter(path):
+                            if is_detail:
+                                await wait()
+                                await path_queue.put(
+                                    await self.async_api_fs_get(path.path)
+                                )
+                            else:
+                                await path_queue.put(path)
+                except Exception as e:
+                    await path_queue.put(e)
+                finally:
+                    dir_queue.task_done()
+
+        async def monitor() -> None:
+            """
+            所有目录遍历完成后放入结束标志
+            """
+            await dir_queue.join()
+            await path_queue.put(None)
+
+        dir_queue.put_nowait(dir_path)
+        tasks = [create_task(walker()) for _ in range(walker_num)]
+        tasks.append(create_task(monitor()))
+
+        try:
+            while True:
+                item = await path_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
 
     async def get_storage_by_mount_path(
         self, mount_path: str, create: bool = False, **kwargs
@@ -1,4 +1,3 @@
-from re import sub
 from typing import Any
 from datetime import datetime
 
@@ -43,10 +42,9 @@ class AlistPath(BaseModel):
         """
         文件下载地址
         """
+        url = self.server_url + "/d" + self.abs_path
         if self.sign:
-            url = self.server_url + "/d" + self.abs_path + "?sign=" + self.sign
-        else:
-            url = self.server_url + "/d" + self.abs_path
+            url += "?sign=" + self.sign
 
         return URLUtils.encode(url)
 
@@ -55,7 +53,7 @@ class AlistPath(BaseModel):
         """
         Alist代理下载地址
         """
-        return sub(r"/d/", "/p/", self.download_url, 1)
+        return self.download_url.replace("/d/", "/p/", 1)
 
     @property
     def suffix(self):
@@ -65,7 +63,7 @@ class AlistPath(BaseModel):
         if self.is_dir:
             return ""
         else:
-            return "." + self.name.split(".")[-1]
+            return "." + self.name.rpartition(".")[2]
 
     def __parse_timestamp(self, time_str: str) -> float:
         """
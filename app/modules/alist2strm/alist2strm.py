@@ -1,10 +1,9 @@
-from asyncio import to_thread, Semaphore, TaskGroup
+from asyncio import to_thread, Queue, Semaphore, TaskGroup
+from contextlib import aclosing
 from os import PathLike
 from pathlib import Path
 from re import compile as re_compile
 
-from aiofile import async_open
-
 from app.core import logger
 from app.utils import RequestUtils
 from app.extensions import VIDEO_EXTS, SUBTITLE_EXTS, IMAGE_EXTS, NFO_EXTS
@@ -12,6 +11,24 @@ from app.modules.alist import AlistClient, AlistPath
 
 
 class Alist2Strm:
+    __slots__ = (
+        "client",
+        "mode",
+        "source_dir",
+        "target_dir",
+        "flatten_mode",
+        "download_exts",
+        "process_file_exts",
+        "overwrite",
+        "max_workers",
+        "__max_downloaders",
+        "wait_time",
+        "sync_server",
+        "sync_ignore_pattern",
+        "processed_local_paths",
+        "created_local_dirs",
+    )
+
     def __init__(
         self,
         url: str = "http://localhost:5244",
@@ -80,7 +97,7 @@ class Alist2Strm:
         self.process_file_exts = VIDEO_EXTS | download_exts
 
         self.overwrite = overwrite
-        self.__max_workers = Semaphore(max_workers)
+        self.max_workers = max(1, max_workers)
         self.__max_downloaders = Semaphore(max_downloaders)
         self.wait_time = wait_time
         self.sync_server = sync_server
@@ -107,7 +124,8 @@ class Alist2Strm:
             if path.is_dir:
                 return False
 
-            if path.suffix.lower() not in self.process_file_exts:
+            suffix = path.suffix.lower()
+            if suffix not in self.process_file_exts:
                 logger.debug(f"文件 {path.name} 不在处理列表中")
                 return False
 
@@ -115,7 +133,7 @@ class Alist2Strm:
             self.processed_local_paths.add(local_path)
 
             if not self.overwrite and local_path.exists():
-                if path.suffix in self.download_exts:
+                if suffix in self.download_exts:
                     local_path_stat = local_path.stat()
                     if local_path_stat.st_mtime < path.modified_timestamp:
                         logger.debug(
@@ -144,15 +162,38 @@ class Alist2Strm:
             is_detail = False
 
         self.processed_local_paths = set()  # 云盘文件对应的本地文件路径
+        self.created_local_dirs = set()  # 本轮已创建的本地目录
 
-        async with self.__max_workers, TaskGroup() as tg:
-            async for path in self.client.iter_path(
-                dir_path=self.source_dir,
-                wait_time=self.wait_time,
-                is_detail=is_detail,
-                filter=filter,
-            ):
-                tg.create_task(self.__file_processer(path))
+        # 有界队列 + 固定数量的处理协程，避免为每个文件创建任务
+        path_queue: Queue[AlistPath | None] = Queue(maxsize=self.max_workers * 2)
+
+        async def worker() -> None:
+            """
+            处理协程
+            从 path_queue 中取出文件并处理，取到 None 时退出
+            """
+            while (path := await path_queue.get()) is not None:
+                await self.__file_processer(path)
+
+        async with TaskGroup() as tg:
+            for _ in range(self.max_workers):
+                tg.create_task(worker())
+
+            # aclosing 保证处理出错时遍历协程被及时取消
+            async with aclosing(
+                self.client.iter_path(
+                    dir_path=self.source_dir,
+                    wait_time=self.wait_time,
+                    is_detail=is_detail,
+                    filter=filter,
+                    max_workers=self.max_workers,
+                )
+            ) as paths:
+                async for path in paths:
+                    await path_queue.put(path)
+
+            for _ in range(self.max_workers):
+                await path_queue.put(None)
 
         if self.sync_server:
             await self.__cleanup_local_files()
@@ -166,26 +207,24 @@ class Alist2Strm:
         :param path: AlistPath 对象
         """
 
-        if path is None:
-            return None
-
         local_path = self.__get_local_path(path)
 
-        if self.mode == "AlistURL":
-            content = path.download_url
-        elif self.mode == "RawURL":
-            content = path.raw_url
-        elif self.mode == "AlistPath":
-            content = path.path
-        else:
-            raise ValueError(f"AlistStrm 未知的模式 {self.mode}")
-
-        await to_thread(local_path.parent.mkdir, parents=True, exist_ok=True)
+        if local_path.parent not in self.created_local_dirs:
+            await to_thread(local_path.parent.mkdir, parents=True, exist_ok=True)
+            self.created_local_dirs.add(local_path.parent)
 
         logger.debug(f"开始处理 {local_path}")
         if local_path.suffix == ".strm":
-            async with async_open(local_path, mode="w", encoding="utf-8") as file:
-                await file.write(content)
+            if self.mode == "AlistURL":
+                content = path.download_url
+            elif self.mode == "RawURL":
+                content = path.raw_url
+            elif self.mode == "AlistPath":
+                content = path.path
+            else:
+                raise ValueError(f"AlistStrm 未知的模式 {self.mode}")
+
+            await to_thread(local_path.write_text, content, encoding="utf-8")
             logger.info(f"{local_path.name} 创建成功")
         else:
             async with self.__max_downloaders:
@@ -200,17 +239,21 @@ class Alist2Strm:
         :return: 本地文件路径
         """
         if self.flatten_mode:
-            local_path = self.target_dir / path.name
+            relative_path = path.name
         else:
-            relative_path = path.path.replace(self.source_dir, "", 1)
+            relative_path = path.path
+            if relative_path.startswith(self.source_dir):
+                relative_path = relative_path[len(self.source_dir) :]
             if relative_path.startswith("/"):
                 relative_path = relative_path[1:]
-            local_path = self.target_dir / relative_path
 
         if path.suffix.lower() in VIDEO_EXTS:
-            local_path = local_path.with_suffix(".strm")
+            # 与 Path.with_suffix 一致：仅替换文件名中的后缀，文件名无后缀时直接追加
+            if path.name.rfind(".") > 0:
+                relative_path = relative_path[: -len(path.suffix)]
+            relative_path += ".strm"
 
-        return local_path
+        return self.target_dir / relative_path
 
     async def __cleanup_local_files(self) -> None:
         """
@@ -4,6 +4,7 @@ import time
 from functools import partial
 from datetime import datetime
 import re
+from pathlib import Path
 
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes, MessageHandler, filters
@@ -1119,10 +1120,14 @@ class TelegramBot(metaclass=Singleton):
         """
         for server in settings.AlistServerList:
             if server.get("id") == server_id:
-                task_func = Alist2Strm(**server).run
+                async def run_server(server: Dict[str, Any] = server) -> None:
+                    # 初始化时会同步登录 Alist 并获取用户信息，放入线程中避免阻塞事件循环
+                    alist2strm = await asyncio.to_thread(Alist2Strm, **server)
+                    await alist2strm.run()
+
                 await self._run_task(
                     callback_query=callback_query,
-                    task_func=task_func,
+                    task_func=run_server,
                     task_args={},
                     task_name=f"Alist2Strm: {server_id}",
                     user_id=user_id
@@ -1159,6 +1164,63 @@ class TelegramBot(metaclass=Singleton):
             parse_mode=ParseMode.MARKDOWN
         )
 
+    @staticmethod
+    def _group_alist2strm_servers(servers: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Group Alist2Strm servers whose target_dir overlap
+        target_dir 相同或存在包含关系的服务器分为一组，组内保持配置顺序
+
+        :param servers: Alist2Strm 服务器配置列表
+        :return: 分组后的服务器配置列表
+        """
+
+        def is_overlapping(a: Path, b: Path) -> bool:
+            return a == b or a in b.parents or b in a.parents
+
+        groups: List[Tuple[List[Path], List[Dict[str, Any]]]] = []
+        for server in servers:
+            target_dir = Path(server.get("target_dir", "")).resolve()
+            merged_dirs: List[Path] = []
+            merged_servers: List[Dict[str, Any]] = []
+            remaining_groups = []
+            for dirs, group_servers in groups:
+                if any(is_overlapping(target_dir, d) for d in dirs):
+                    merged_dirs += dirs
+                    merged_servers += group_servers
+                else:
+                    remaining_groups.append((dirs, group_servers))
+            merged_dirs.append(target_dir)
+            merged_servers.append(server)
+            groups = remaining_groups + [(merged_dirs, merged_servers)]
+
+        return [group_servers for _, group_servers in groups]
+
+    async def _run_alist2strm_servers(self) -> None:
+        """
+        Run every configured Alist2Strm server
+        target_dir 互不重叠的服务器并发执行；重叠的服务器按配置顺序依次执行，
+        避免 sync_server 清理时删除另一服务器正在生成的文件。单个任务出错不影响其他任务
+        """
+
+        async def run_server(server: Dict[str, Any]) -> None:
+            server_id = server.get("id", "未命名")
+            try:
+                logger.info(f"开始执行 Alist2Strm {server_id} 任务")
+                # 初始化时会同步登录 Alist 并获取用户信息，放入线程中避免阻塞事件循环
+                alist2strm = await asyncio.to_thread(Alist2Strm, **server)
+                await alist2strm.run()
+                logger.info(f"Alist2Strm {server_id} 任务完成")
+            except Exception as e:
+                logger.error(f"Alist2Strm {server_id} 任务出错: {str(e)}")
+                # 继续执行其他任务，而不是直接失败
+
+        async def run_group(servers: List[Dict[str, Any]]) -> None:
+            for server in servers:
+                await run_server(server)
+
+        groups = self._group_alist2strm_servers(settings.AlistServerList)
+        await asyncio.gather(*(run_group(servers) for servers in groups))
+
     async def _run_all_alist2strm(self, callback_query: CallbackQuery, user_id: int) -> None:
         """
         Run all Alist2Strm tasks
@@ -1178,20 +1240,9 @@ class TelegramBot(metaclass=Singleton):
             parse_mode=ParseMode.MARKDOWN
         )
 
-        async def run_all_alist2strm() -> None:
-            for server in settings.AlistServerList:
-                server_id = server.get("id", "未命名")
-                try:
-                    logger.info(f"开始执行 Alist2Strm {server_id} 任务")
-                    await Alist2Strm(**server).run()
-                    logger.info(f"Alist2Strm {server_id} 任务完成")
-                except Exception as e:
-                    logger.error(f"Alist2Strm {server_id} 任务出错: {str(e)}")
-                    # 继续执行其他任务，而不是直接失败
-
         await self._run_task(
             callback_query=callback_query,
-            task_func=run_all_alist2strm,
+            task_func=self._run_alist2strm_servers,
             task_args={},
             task_name="所有 Alist2Strm 任务",
             user_id=user_id
@@ -1256,15 +1307,7 @@ class TelegramBot(metaclass=Singleton):
 
         async def run_all_tasks() -> None:
             # 运行 Alist2Strm 任务
-            for server in settings.AlistServerList:
-                server_id = server.get("id", "未命名")
-                try:
-                    logger.info(f"开始执行 Alist2Strm {server_id} 任务")
-                    await Alist2Strm(**server).run()
-                    logger.info(f"Alist2Strm {server_id} 任务完成")
-                except Exception as e:
-                    logger.error(f"Alist2Strm {server_id} 任务出错: {str(e)}")
-                    # 继续执行其他任务，而不是直接失败
+            await self._run_alist2strm_servers()
 
             # 运行 Ani2Alist 任务
             for server in settings.Ani2AlistList:
@@ -1,5 +1,4 @@
-from hmac import new as hmac_new
-from hashlib import sha256 as hashlib_sha256
+from hmac import digest as hmac_digest
 from base64 import urlsafe_b64encode
 
 from app.utils.singleton import Singleton
@@ -21,10 +20,11 @@ class AlistUtils(metaclass=Singleton):
         if not secret_key:
             return ""
         else:
-            h = hmac_new(secret_key.encode(), digestmod=hashlib_sha256)
             expire_time_stamp = str(0)
-            h.update((data + ":" + expire_time_stamp).encode())
-            return f"?sign={urlsafe_b64encode(h.digest()).decode()}:0"
+            sign = hmac_digest(
+                secret_key.encode(), (data + ":" + expire_time_stamp).encode(), "sha256"
+            )
+            return f"?sign={urlsafe_b64encode(sign).decode()}:0"
 
     @staticmethod
     def structure2dict(text: str) -> dict:
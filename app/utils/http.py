@@ -1,13 +1,11 @@
 from typing import Any, Literal, overload
 from pathlib import Path
-from os import makedirs
-from asyncio import TaskGroup, to_thread
+from os import makedirs, replace
+from asyncio import TaskGroup, shield, to_thread
 from collections.abc import Coroutine
-from tempfile import TemporaryDirectory
-from shutil import copy
 from weakref import WeakSet
 
-from httpx import AsyncClient, Client, Response, TimeoutException
+from httpx import AsyncClient, Client, Limits, Response, TimeoutException
 from aiofile import async_open
 
 from app.core import settings, logger
@@ -22,6 +20,10 @@ class HTTPClient:
 
     # 最小流式下载文件大小，128MB
     MINI_STREAM_SIZE: int = 128 * 1024 * 1024
+    # 连接池限制，保持空闲连接 30 秒以便后续请求复用
+    LIMITS: Limits = Limits(
+        max_connections=100, max_keepalive_connections=50, keepalive_expiry=30
+    )
     # 默认请求头
     HEADERS: dict[str, str] = {
         "User-Agent": f"AutoFilm/{settings.APP_VERSION}",
@@ -33,6 +35,7 @@ class HTTPClient:
         初始化 HTTP 客户端
         """
 
+        self.__active_requests = 0  # 正在进行的异步请求数（含流式下载）
         self.__new_async_client()
         self.__new_sync_client()
 
@@ -40,13 +43,17 @@ class HTTPClient:
         """
         创建新的同步 HTTP 客户端
         """
-        self.__sync_client = Client(http2=True, follow_redirects=True, timeout=10)
+        self.__sync_client = Client(
+            http2=True, follow_redirects=True, timeout=10, limits=self.LIMITS
+        )
 
     def __new_async_client(self):
         """
         创建新的异步 HTTP 客户端
         """
-        self.__async_client = AsyncClient(http2=True, follow_redirects=True, timeout=10)
+        self.__async_client = AsyncClient(
+            http2=True, follow_redirects=True, timeout=10, limits=self.LIMITS
+        )
 
     def close_sync_client(self) -> None:
         """
@@ -62,6 +69,18 @@ class HTTPClient:
         if self.__async_client:
             await self.__async_client.aclose()
 
+    async def __reset_async_client(self) -> None:
+        """
+        重建异步 HTTP 客户端
+        存在其他进行中的请求时跳过，避免中断共用该客户端（及 HTTP/2 连接）的其他请求
+        """
+        if self.__active_requests:
+            logger.debug("存在进行中的请求，跳过重建异步 HTTP 客户端")
+            return
+        old_client = self.__async_client
+        self.__new_async_client()  # 先替换再关闭，关闭期间发起的新请求使用新客户端
+        await old_client.aclose()
+
     @Retry.sync_retry(TimeoutException, tries=3, delay=1, backoff=2)
     def _sync_request(self, method: str, url: str, **kwargs) -> Response | None:
         """
@@ -79,12 +98,27 @@ class HTTPClient:
         """
         发起异步 HTTP 请求
         """
+        self.__active_requests += 1
         try:
             return await self.__async_client.request(method, url, **kwargs)
         except TimeoutException as e:
-            await self.close_async_client()
-            self.__new_async_client()
-            raise TimeoutException(f"HTTP 请求超时：{e}")
+            timeout_error = e
+        finally:
+            self.__active_requests -= 1
+
+        # 本请求已不再计数，仅在没有其他进行中的请求时重建客户端
+        await self.__reset_async_client()
+        raise TimeoutException(f"HTTP 请求超时：{timeout_error}")
+
+    async def _async_stream(self, method: str, url: str, **kwargs) -> Response:
+        """
+        发起异步 HTTP 流式请求
+        仅读取响应头，响应体需由调用方通过 aiter_bytes 读取并调用 aclose 关闭
+        超时不在此处重试，由调用方对整个请求（含响应体）重试
+        """
+        kwargs["headers"] = kwargs.get("headers", self.HEADERS)
+        request = self.__async_client.build_request(method, url, **kwargs)
+        return await self.__async_client.send(request, stream=True)
 
     @overload
     def request(
@@ -252,25 +286,39 @@ class HTTPClient:
 
         file_size = int(resp.headers.get("Content-Length", -1))
 
-        with TemporaryDirectory(prefix="AutoFilm_") as temp_dir:  # 创建临时目录
-            temp_file = Path(temp_dir) / file_path.name
+        # 先下载至同目录下的临时文件，完成后原子重命名，避免中断时留下不完整文件
+        temp_file = file_path.with_name(f".{file_path.name}.part")
+        await to_thread(makedirs, file_path.parent, exist_ok=True)
+        await to_thread(temp_file.write_bytes, b"")  # 创建（或清空）临时文件
 
+        try:
             if file_size == -1:
                 logger.debug(f"{file_path.name} 文件大小未知，直接下载")
-                await self.__download_chunk(url, temp_file, 0, 0, **kwargs)
+                results = [await self.__download_chunk(url, temp_file, 0, 0, **kwargs)]
             else:
                 async with TaskGroup() as tg:
                     logger.debug(
                         f"开始分片下载文件：{file_path.name}，分片数:{chunk_num}"
                     )
-                    for start, end in self.caculate_divisional_range(
-                        file_size, chunk_num=chunk_num
-                    ):
+                    tasks = [
                         tg.create_task(
                             self.__download_chunk(url, temp_file, start, end, **kwargs)
                         )
-            copy(temp_file, file_path)
+                        for start, end in self.caculate_divisional_range(
+                            file_size, chunk_num=chunk_num
+                        )
+                    ]
+                results = [task.result() for task in tasks]
+
+            if not all(results):
+                raise RuntimeError(f"下载文件 {file_path.name} 失败，超出最大重试次数")
+            await to_thread(replace, temp_file, file_path)
+        except BaseException:
+            # shield 保证下载被取消时临时文件仍会被删除
+            await shield(to_thread(temp_file.unlink, missing_ok=True))
+            raise
 
+    @Retry.async_retry(TimeoutException, tries=3, delay=1, backoff=2)
     async def __download_chunk(
         self,
         url: str,
@@ -279,30 +327,41 @@ class HTTPClient:
         end: int,
         iter_chunked_size: int = 64 * 1024,
         **kwargs,
-    ):
+    ) -> bool:
         """
         下载文件的分片
+        超时（包括读取响应体时超时）时整个分片从 start 处重新下载
 
         :param url: 文件的 URL
-        :param file_path: 文件保存路径
+        :param file_path: 文件保存路径（需已存在）
         :param start: 分片的开始位置
         :param end: 分片的结束位置
-        :param iter_chunked_size: 下载的块大小（下载完成后再写入硬盘），默认为 64KB
+        :param iter_chunked_size: 流式写入硬盘的块大小，默认为 64KB
         :param kwargs: 其他请求参数，如 headers, cookies, proxies 等
+        :return: 下载成功返回 True，超出最大重试次数时返回 None
         """
 
-        await to_thread(makedirs, file_path.parent, exist_ok=True)
-
         if start != 0 and end != 0:
-            headers = kwargs.get("headers", {})
+            headers = dict(kwargs.get("headers", {}))
             headers["Range"] = f"bytes={start}-{end}"
             kwargs["headers"] = headers
 
-        resp = await self.get(url, sync=False, **kwargs)
-        async with async_open(file_path, "ab") as file:
-            file.seek(start)
-            async for chunk in resp.aiter_bytes(iter_chunked_size):
-                await file.write(chunk)
+        self.__active_requests += 1
+        try:
+            resp = await self._async_stream("get", url, **kwargs)
+            try:
+                async with async_open(file_path, "rb+") as file:
+                    file.seek(start)
+                    async for chunk in resp.aiter_bytes(iter_chunked_size):
+                        await file.write(chunk)
+            finally:
+                await resp.aclose()
+        except TimeoutException as e:
+            raise TimeoutException(f"下载文件 {file_path.name} 超时：{e}")
+        finally:
+            self.__active_requests -= 1
+
+        return True
 
     @staticmethod
     def caculate_divisional_range(
@@ -1,18 +1,22 @@
 import abc
+from threading import RLock
 
 
 class Multiton(abc.ABCMeta, type):
     """
     多例模式
+    线程安全，可在 to_thread 中创建实例
     """
 
     _instances: dict = {}
+    _lock = RLock()
 
     def __call__(cls, *args, **kwargs):
         key = (cls, args, frozenset(kwargs.items()))
-        if key not in cls._instances:
-            cls._instances[key] = super().__call__(*args, **kwargs)
-        return cls._instances[key]
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = super().__call__(*args, **kwargs)
+            return cls._instances[key]
 
 
 if __name__ == "__main__":